@@ -14,41 +14,45 @@
 # limitations under the License.
 #
 
-import numpy as np
+import sys
+from pathlib import Path
 
-def print_statistics(processing_times, batch_size):
-    print('\nprocessing time for all iterations')
-    print('average time: {:.2f} ms; average speed: {:.2f} fps'
-          .format(round(np.average(processing_times), 2),
-                  round(1000 * batch_size / np.average(processing_times), 2)))
+import numpy as np
 
-    print('median time: {:.2f} ms; median speed: {:.2f} fps'
-          .format(round(np.median(processing_times), 2),
-                 round(1000 * batch_size / np.median(processing_times), 2)))
+def _percentile_sorted(sorted_times, q):
+    # Linear interpolation between closest ranks, same as np.percentile default
+    position = (len(sorted_times) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_times) - 1)
+    return sorted_times[lower] + (sorted_times[upper] - sorted_times[lower]) * (position - lower)
 
-    print('max time: {:.2f} ms; min speed: {:.2f} fps'.format(round(np.max(processing_times), 2),round(1000 * batch_size / np.max(processing_times), 2)))
+def _compute_stats(processing_times):
+    mean = processing_times.mean()
+    std = processing_times.std()
+    sorted_times = np.sort(processing_times)
+    return (mean, std, std * std, sorted_times[0], sorted_times[-1],
+            _percentile_sorted(sorted_times, 50), _percentile_sorted(sorted_times, 90))
 
-    print('min time: {:.2f} ms; max speed: {:.2f} fps'.format(round(np.min(processing_times), 2),
-                                                          round(1000 * batch_size / np.min(processing_times), 2)))
+def print_statistics(processing_times, batch_size):
+    processing_times = np.ascontiguousarray(processing_times, dtype=np.float64)
+    mean, std, var, mn, mx, p50, p90 = _compute_stats(processing_times)
 
-    print('time percentile 90: {:.2f} ms; speed percentile 90: {:.2f} fps'.format(
-    round(np.percentile(processing_times, 90), 2),
-    round(1000 * batch_size / np.percentile(processing_times, 90), 2)
-))
-    print('time percentile 50: {:.2f} ms; speed percentile 50: {:.2f} fps'.format(
-    round(np.percentile(processing_times, 50), 2),
-    round(1000 * batch_size / np.percentile(processing_times, 50), 2)))
-    print('time standard deviation: {:.2f}'.format(round(np.std(processing_times), 2)))
-    print('time variance: {:.2f}'.format(round(np.var(processing_times), 2)))
+    speed = 1000.0 * batch_size
+    sys.stdout.write(f'\nprocessing time for all iterations\n'
+                     f'average time: {mean:.2f} ms; average speed: {speed / mean:.2f} fps\n'
+                     f'median time: {p50:.2f} ms; median speed: {speed / p50:.2f} fps\n'
+                     f'max time: {mx:.2f} ms; min speed: {speed / mx:.2f} fps\n'
+                     f'min time: {mn:.2f} ms; max speed: {speed / mn:.2f} fps\n'
+                     f'time percentile 90: {p90:.2f} ms; speed percentile 90: {speed / p90:.2f} fps\n'
+                     f'time percentile 50: {p50:.2f} ms; speed percentile 50: {speed / p50:.2f} fps\n'
+                     f'time standard deviation: {std:.2f}\n'
+                     f'time variance: {var:.2f}\n')
 
 def prepare_certs(server_cert=None, client_key=None, client_ca=None):
     if server_cert is not None:
-        with open(server_cert, 'rb') as f:
-            server_cert = f.read()
+        server_cert = Path(server_cert).read_bytes()
     if client_key is not None:
-        with open(client_key, 'rb') as key:
-            client_key = key.read()
+        client_key = Path(client_key).read_bytes()
     if client_ca is not None:
-        with open(client_ca, 'rb') as ca:
-            client_ca = ca.read()
+        client_ca = Path(client_ca).read_bytes()
     return server_cert, client_key, client_ca
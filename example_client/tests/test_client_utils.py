@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+from client_utils import print_statistics  # noqa
+
+
+def baseline_statistics(processing_times, batch_size):
+    # Output of the original implementation, built from separate NumPy calls
+    lines = ['', 'processing time for all iterations']
+    for label, speed_label, value in [
+            ('average time', 'average speed', np.average(processing_times)),
+            ('median time', 'median speed', np.median(processing_times)),
+            ('max time', 'min speed', np.max(processing_times)),
+            ('min time', 'max speed', np.min(processing_times)),
+            ('time percentile 90', 'speed percentile 90', np.percentile(processing_times, 90)),
+            ('time percentile 50', 'speed percentile 50', np.percentile(processing_times, 50))]:
+        lines.append('{}: {:.2f} ms; {}: {:.2f} fps'.format(
+            label, round(value, 2), speed_label, round(1000 * batch_size / value, 2)))
+    lines.append('time standard deviation: {:.2f}'.format(round(np.std(processing_times), 2)))
+    lines.append('time variance: {:.2f}'.format(round(np.var(processing_times), 2)))
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("processing_times, batch_size", [
+    ([12], 1),
+    ([12, 17, 15, 31], 1),
+    ([12, 17, 15, 31, 22], 8),
+    ([0, 14, 19, 11], 1),
+    (np.array([12, 17, 15, 31, 22, 40, 9], dtype=np.int64), 1),
+    ([3.41, 5.27, 4.86, 10.13, 7.72, 6.09], 1),
+    (np.array([3.41, 5.27, 4.86, 10.13, 7.72, 6.09]), 0.128),
+], ids=("single sample", "even length", "odd length", "zero ms sample",
+        "int64 ndarray", "float list", "float ndarray fractional batch"))
+def test_print_statistics_matches_baseline(capsys, processing_times, batch_size):
+    expected = baseline_statistics(processing_times, batch_size)
+    print_statistics(processing_times, batch_size)
+    assert capsys.readouterr().out == expected
@@ -16,6 +16,9 @@
 
 import pytest
 import numpy as np
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
 
 from config import target_device, skip_nginx_test, skip_hddl_tests
 from constants import MODEL_SERVICE
@@ -30,6 +33,41 @@ from utils.rest import get_predict_url, get_metadata_url, get_status_url, infer_
 
 logger = logging.getLogger(__name__)
 
+VERSION_IDS = ("version 1", "version 2", "no version specified")
+VERSIONS_WITH_MODEL_INFO = [(1, PVBFaceDetection[0]), (2, PVBFaceDetection[1]), (None, PVBFaceDetectionV2)]
+EXPECTED_METADATA = {
+    version: ({model_info.input_name: {'dtype': 1, 'shape': list(model_info.input_shape)}},
+              {model_info.output_name: {'dtype': 1, 'shape': list(model_info.output_shape)}})
+    for version, model_info in VERSIONS_WITH_MODEL_INFO
+}
+
+_ZEROS_CACHE = {}
+
+
+@lru_cache(maxsize=None)
+def _predict_url(model_name, port, version):
+    return get_predict_url(model=model_name, port=port, version=version)
+
+
+@lru_cache(maxsize=None)
+def _metadata_url(model_name, port, version):
+    return get_metadata_url(model=model_name, port=port, version=version)
+
+
+@lru_cache(maxsize=None)
+def _status_url(model_name, port, version):
+    return get_status_url(model=model_name, port=port, version=version)
+
+
+def _zeros(shape, dtype):
+    # Inputs are only read by infer/infer_rest, so one buffer per shape and dtype can be shared
+    key = (tuple(shape), np.dtype(dtype).str)
+    img = _ZEROS_CACHE.get(key)
+    if img is None:
+        img = np.zeros(shape, dtype=dtype)
+        _ZEROS_CACHE[key] = img
+    return img
+
 
 @pytest.mark.skipif(skip_hddl_tests, reason="Shapes are not supported by HDDL")
 @pytest.mark.skipif(skip_nginx_test, reason="not implemented yet")
@@ -38,42 +76,45 @@ logger = logging.getLogger(__name__)
 class TestModelVersionHandling:
     model_name = "pvb_face_multi_version"
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_run_inference(self, start_server_multi_model, version):
+    @pytest.fixture(scope="class")
+    def grpc_stub(self, start_server_multi_model):
+        _, ports = start_server_multi_model
+        return create_channel(port=ports["grpc_port"])
 
+    @pytest.fixture(scope="class")
+    def model_status_stub(self, start_server_multi_model):
         _, ports = start_server_multi_model
+        return create_channel(port=ports["grpc_port"], service=MODEL_SERVICE)
+
+    @pytest.fixture(scope="class")
+    def rest_session(self):
+        with requests.Session() as session:
+            session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+            yield session
 
-        # Connect to grpc service
-        stub = create_channel(port=ports["grpc_port"])
-        model_info = PVBFaceDetectionV2 if version is None else PVBFaceDetection[version - 1]
+    @pytest.mark.parametrize("version,model_info", VERSIONS_WITH_MODEL_INFO, ids=VERSION_IDS)
+    def test_run_inference(self, grpc_stub, version, model_info):
 
-        img = np.ones(model_info.input_shape, dtype=model_info.dtype)
+        img = _zeros(model_info.input_shape, model_info.dtype)
 
         output = infer(img, input_tensor=model_info.input_name,
-                       grpc_stub=stub, model_spec_name=self.model_name,
+                       grpc_stub=grpc_stub, model_spec_name=self.model_name,
                        model_spec_version=version,  # face detection
                        output_tensors=[model_info.output_name])
         logger.info("Output shape: {}".format(output[model_info.output_name].shape))
         assert output[model_info.output_name].shape == model_info.output_shape, \
             '{} with version 1 has invalid output'.format(self.model_name)
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_get_model_metadata(self, start_server_multi_model, version):
-
-        _, ports = start_server_multi_model
-
-        # Connect to grpc service
-        stub = create_channel(port=ports["grpc_port"])
-        model_info = PVBFaceDetectionV2 if version is None else PVBFaceDetection[version - 1]
+    @pytest.mark.parametrize("version", [1, 2, None], ids=VERSION_IDS)
+    def test_get_model_metadata(self, grpc_stub, version):
 
         logger.info("Getting info about pvb_face_detection model "
               "version: {}".format("no_version" if version is None else version))
-        expected_input_metadata = {model_info.input_name: {'dtype': 1, 'shape': list(model_info.input_shape)}}
-        expected_output_metadata = {model_info.output_name: {'dtype': 1, 'shape': list(model_info.output_shape)}}
+        expected_input_metadata, expected_output_metadata = EXPECTED_METADATA[version]
 
         request = get_model_metadata(model_name=self.model_name,
                                      version=version)
-        response = stub.GetModelMetadata(request, 10)
+        response = grpc_stub.GetModelMetadata(request, 10)
         input_metadata, output_metadata = model_metadata_response(
             response=response)
         logger.info("Input metadata: {}".format(input_metadata))
@@ -83,16 +124,12 @@ class TestModelVersionHandling:
         assert expected_input_metadata == input_metadata
         assert expected_output_metadata == output_metadata
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_get_model_status(self, start_server_multi_model, version):
+    @pytest.mark.parametrize("version", [1, 2, None], ids=VERSION_IDS)
+    def test_get_model_status(self, model_status_stub, version):
 
-        _, ports = start_server_multi_model
-
-        # Connect to grpc service
-        stub = create_channel(port=ports["grpc_port"], service=MODEL_SERVICE)
         request = get_model_status(model_name=self.model_name,
                                    version=version)
-        response = stub.GetModelStatus(request, 10)
+        response = model_status_stub.GetModelStatus(request, 10)
 
         versions_statuses = response.model_version_status
         version_status = versions_statuses[0]
@@ -105,36 +142,31 @@ class TestModelVersionHandling:
         assert version_status.status.error_message == ERROR_MESSAGE[
             ModelVersionState.AVAILABLE][ErrorCode.OK]
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_run_inference_rest(self, start_server_multi_model, version):
+    @pytest.mark.parametrize("version,model_info", VERSIONS_WITH_MODEL_INFO, ids=VERSION_IDS)
+    def test_run_inference_rest(self, start_server_multi_model, rest_session, version, model_info):
 
         _, ports = start_server_multi_model
 
-        model_info = PVBFaceDetectionV2 if version is None else PVBFaceDetection[version - 1]
-
-        img = np.ones(model_info.input_shape, dtype=model_info.dtype)
-        rest_url = get_predict_url(model=self.model_name, port=ports["rest_port"], version=version)
+        img = _zeros(model_info.input_shape, model_info.dtype)
+        rest_url = _predict_url(self.model_name, ports["rest_port"], version)
         output = infer_rest(img,
                             input_tensor=model_info.input_name, rest_url=rest_url,
                             output_tensors=[model_info.output_name],
-                            request_format='column_name')
+                            request_format='column_name', session=rest_session)
         logger.info("Output shape: {}".format(output[model_info.output_name].shape))
         assert output[model_info.output_name].shape == model_info.output_shape, \
             '{} with version 1 has invalid output'.format(self.model_name)
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_get_model_metadata_rest(self, start_server_multi_model, version):
+    @pytest.mark.parametrize("version", [1, 2, None], ids=VERSION_IDS)
+    def test_get_model_metadata_rest(self, start_server_multi_model, rest_session, version):
 
         _, ports = start_server_multi_model
 
-        model_info = PVBFaceDetectionV2 if version is None else PVBFaceDetection[version - 1]
-
-        rest_url = get_metadata_url(model=self.model_name, port=ports["rest_port"], version=version)
+        rest_url = _metadata_url(self.model_name, ports["rest_port"], version)
 
-        expected_input_metadata = {model_info.input_name: {'dtype': 1, 'shape': list(model_info.input_shape)}}
-        expected_output_metadata = {model_info.output_name: {'dtype': 1, 'shape': list(model_info.output_shape)}}
+        expected_input_metadata, expected_output_metadata = EXPECTED_METADATA[version]
         logger.info("Getting info about resnet model version: {}".format(rest_url))
-        response = get_model_metadata_response_rest(rest_url)
+        response = get_model_metadata_response_rest(rest_url, session=rest_session)
         input_metadata, output_metadata = model_metadata_response(response=response)
         logger.info("Input metadata: {}".format(input_metadata))
         logger.info("Output metadata: {}".format(output_metadata))
@@ -143,14 +175,14 @@ class TestModelVersionHandling:
         assert expected_input_metadata == input_metadata
         assert expected_output_metadata == output_metadata
 
-    @pytest.mark.parametrize("version", [1, 2, None], ids=("version 1", "version 2", "no version specified"))
-    def test_get_model_status_rest(self, start_server_multi_model, version):
+    @pytest.mark.parametrize("version", [1, 2, None], ids=VERSION_IDS)
+    def test_get_model_status_rest(self, start_server_multi_model, rest_session, version):
 
         _, ports = start_server_multi_model
 
-        rest_url = get_status_url(model=self.model_name, port=ports["rest_port"], version=version)
+        rest_url = _status_url(self.model_name, ports["rest_port"], version)
 
-        response = get_model_status_response_rest(rest_url)
+        response = get_model_status_response_rest(rest_url, session=rest_session)
         versions_statuses = response.model_version_status
         version_status = versions_statuses[0]
         if version is None:
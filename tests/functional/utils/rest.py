@@ -127,21 +127,24 @@ def _get_output_json(rest_url, method_to_call, raise_error = True,
     return result.text, output_json
 
 def infer_rest(img, input_tensor, rest_url,
-               output_tensors, request_format, raise_error=True):
-    _, _json = _get_output_json(rest_url, requests.post, raise_error, img, input_tensor, request_format, infer_timeout)
+               output_tensors, request_format, raise_error=True, session=None):
+    http = requests if session is None else session
+    _, _json = _get_output_json(rest_url, http.post, raise_error, img, input_tensor, request_format, infer_timeout)
     data = process_json_output(_json, output_tensors)
     return data
 
 
-def get_model_metadata_response_rest(rest_url):
-    _txt, _ = _get_output_json(rest_url, requests.get)
+def get_model_metadata_response_rest(rest_url, session=None):
+    http = requests if session is None else session
+    _txt, _ = _get_output_json(rest_url, http.get)
     metadata_pb = get_model_metadata_pb2.GetModelMetadataResponse()
     response = Parse(_txt, metadata_pb, ignore_unknown_fields=False)
     return response
 
 
-def get_model_status_response_rest(rest_url):
-    _txt, _ = _get_output_json(rest_url, requests.get)
+def get_model_status_response_rest(rest_url, session=None):
+    http = requests if session is None else session
+    _txt, _ = _get_output_json(rest_url, http.get)
     status_pb = get_model_status_pb2.GetModelStatusResponse()
     response = Parse(_txt, status_pb, ignore_unknown_fields=False)
     return response